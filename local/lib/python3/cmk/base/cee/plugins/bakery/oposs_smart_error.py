@@ -5,9 +5,8 @@ Automatically distributes the agent plugin to monitored hosts
 Compatible with CheckMK 2.3
 """
 
-import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any
 
 from cmk.base.plugins.bakery.bakery_api.v1 import (
     register,
@@ -16,30 +15,38 @@ from cmk.base.plugins.bakery.bakery_api.v1 import (
     OS,
 )
 
+# Bakery-relative paths, the same for every host
+_CONFIG_TARGET = Path("oposs_smart_error.json")
+_PLUGIN_PATH = Path("oposs_smart_error")
+# Plugin configuration, the schema is fixed so no JSON encoder is needed
+_CONFIG_LINE = '{"timeout": %d}'
 
-def get_oposs_smart_error_files(conf: Dict[str, Any]):
+
+def get_oposs_smart_error_files(conf: dict[str, Any]):
     """Files function for OPOSS SMART error bakery plugin"""
-    if conf is None or not conf.get("enabled", True):
+    if conf is None:
+        return
+    get = conf.get
+    if not get("enabled", True):
         return
     
     # Get configuration values
-    interval = int(conf.get("interval", 0))
-    timeout = conf.get("timeout", 30)
+    interval = int(get("interval", 0))
+    timeout = get("timeout", 5)  # same default as the agent plugin and the rule form
 
     # Generate config file in JSON format
-    config_content = json.dumps({"timeout": int(timeout)})
     yield PluginConfig(
         base_os=OS.LINUX,
-        target=Path("oposs_smart_error.json"),
-        lines=config_content.splitlines(),
+        target=_CONFIG_TARGET,
+        lines=[_CONFIG_LINE % timeout],
     )
 
     # Generate plugin using source reference
     # This will automatically find the agent plugin in local/share/check_mk/agents/plugins/
     yield Plugin(
         base_os=OS.LINUX,
-        source=Path('oposs_smart_error'),
-        target=Path('oposs_smart_error'),
+        source=_PLUGIN_PATH,
+        target=_PLUGIN_PATH,
         interval=interval,
     )
 
@@ -7,7 +7,8 @@ Compatible with CheckMK 2.3
 """
 
 import json
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+import sys
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
 
 from cmk.agent_based.v2 import (
     AgentSection,
@@ -23,8 +24,115 @@ from cmk.agent_based.v2 import (
     check_levels,
 )
 
+# Prefer the faster msgspec or orjson decoders, fall back to the stdlib parser.
+# json.JSONDecodeError and orjson.JSONDecodeError subclass ValueError,
+# msgspec.DecodeError does not.
+_JSON_DECODE_ERRORS: Tuple[type, ...] = (ValueError,)
+try:
+    from msgspec import DecodeError as _MsgspecDecodeError
+    from msgspec.json import Decoder as _MsgspecDecoder
 
-Section = Dict[str, Dict[str, Any]]
+    _json_loads = _MsgspecDecoder().decode
+    _JSON_DECODE_ERRORS += (_MsgspecDecodeError,)
+except ImportError:
+    try:
+        from orjson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
+
+
+Devices = Dict[str, Dict[str, Any]]
+
+
+class Section(NamedTuple):
+    """Parsed device records plus the service item -> device name index"""
+    devices: Devices
+    item_index: Dict[str, str]
+
+
+_OPERATIONS = ("read", "write", "verify")
+_OPERATION_INDEX = {op: idx for idx, op in enumerate(_OPERATIONS)}
+
+# Counter fields read by the check, filled in at parse time when missing
+_COUNTER_DEFAULTS = (
+    ("errors_corrected_by_eccfast", 0),
+    ("errors_corrected_by_eccdelayed", 0),
+    ("errors_corrected_by_rereads_rewrites", 0),
+    ("correction_algorithm_invocations", 0),
+    ("gigabytes_processed", 0.0),
+    ("total_uncorrected_errors", 0),
+)
+
+_BYTES_PER_GB = 1 << 30
+_GB_PER_TB = 1024.0
+
+
+def _build_metric_names(operation: str) -> Dict[str, str]:
+    """Absolute metric names for one operation type"""
+    return {
+        "eccfast": f"{operation}_errors_corrected_by_eccfast",
+        "eccdelayed": f"{operation}_errors_corrected_by_eccdelayed",
+        "rereads": f"{operation}_errors_corrected_by_rereads_rewrites",
+        "algorithm": f"{operation}_correction_algorithm_invocations",
+        "bytes": f"{operation}_bytes_processed",
+        "uncorrected": f"{operation}_total_uncorrected_errors",
+    }
+
+
+def _build_per_tb_names(operation: str) -> Dict[str, str]:
+    """Per-TB rate metric names for one operation type"""
+    return {
+        "eccfast": f"{operation}_errors_corrected_by_eccfast_per_tb",
+        "eccdelayed": f"{operation}_errors_corrected_by_eccdelayed_per_tb",
+        "rereads": f"{operation}_errors_corrected_by_rereads_rewrites_per_tb",
+        "algorithm": f"{operation}_correction_algorithm_invocations_per_tb",
+    }
+
+
+def _intern_names(names: Dict[str, str]) -> Dict[str, str]:
+    """Intern metric names so every Metric of a kind shares one string object"""
+    return {key: sys.intern(name) for key, name in names.items()}
+
+
+# Metric names are fixed per operation, build them once
+_METRIC_NAMES = {op: _intern_names(_build_metric_names(op)) for op in _OPERATIONS}
+_PER_TB_NAMES = {op: _intern_names(_build_per_tb_names(op)) for op in _OPERATIONS}
+
+# Threshold evaluation per counter: ruleset key suffix, counter field, check
+# metric suffix, check label, summary label if no levels are configured
+# (None: don't report) and default levels (None: no default)
+_THRESHOLD_COUNTERS = (
+    ("uncorrected_errors_abs", "total_uncorrected_errors", "uncorrected_check",
+     "uncorrected errors", None, ("fixed", (1, 1))),  # any uncorrected error is critical
+    ("eccfast_errors_abs", "errors_corrected_by_eccfast", "eccfast_check",
+     "ECC fast errors", "ECC fast", None),
+    ("eccdelayed_errors_abs", "errors_corrected_by_eccdelayed", "eccdelayed_check",
+     "ECC delayed errors", "ECC delayed", None),
+    ("rereads_rewrites_errors_abs", "errors_corrected_by_rereads_rewrites", "rereads_rewrites_check",
+     "rereads/rewrites errors", "rereads/rewrites", None),
+    ("algorithm_invocations_abs", "correction_algorithm_invocations", "algorithm_invocations_check",
+     "algorithm invocations", None, None),
+)
+
+# Fully formatted (param_key, field, metric_name, label, summary_label, default_levels) per operation
+_THRESHOLD_CHECKS = {
+    op: tuple(
+        (
+            f"{op}_{param_suffix}",
+            field,
+            sys.intern(f"{op}_{metric_suffix}"),
+            f"{op.capitalize()} {label}",
+            f"{op.capitalize()} {summary_label}" if summary_label else None,
+            default_levels,
+        )
+        for param_suffix, field, metric_suffix, label, summary_label, default_levels in _THRESHOLD_COUNTERS
+    )
+    for op in _OPERATIONS
+}
+
+
+# Level modes check_levels() accepts as first element of a levels tuple
+_LEVELS_MODES = frozenset(("fixed", "no_levels", "predictive"))
 
 
 def _render_error_count(value: float) -> str:
@@ -32,96 +140,180 @@ def _render_error_count(value: float) -> str:
     return f"{int(value)}"
 
 
+def _norm_levels(levels_param: Any) -> Optional[Tuple[str, Any]]:
+    """Turn a SimpleLevels ruleset value into check_levels() format, None if unset"""
+    if isinstance(levels_param, tuple) and len(levels_param) == 2:
+        mode = levels_param[0]
+        if mode in _LEVELS_MODES:
+            # Native SimpleLevels value: ("fixed", (warn, crit)) or ("no_levels", None)
+            return levels_param
+        if isinstance(mode, (int, float)) and isinstance(levels_param[1], (int, float)):
+            # Bare (warn, crit) pair
+            return ("fixed", levels_param)
+        return None
+    if isinstance(levels_param, dict) and "levels_upper" in levels_param:
+        return ("fixed", levels_param["levels_upper"])
+    return None
+
+
+def _short_serial(serial: str) -> str:
+    """Last 8 characters of the serial number, enough to tell drives apart"""
+    return serial[-8:]
+
+
 def _create_device_description(device_path: str, model: str, serial: str, capacity_bytes: int) -> str:
     """Create a friendly device description"""
-    parts = []
+    model_part = f"{model} " if model else ""
+    capacity_part = f"({render.bytes(capacity_bytes)}) " if capacity_bytes > 0 else ""
+    # Show last 8 characters of serial for identification
+    serial_part = f"S/N: {_short_serial(serial)} " if serial else ""
     
-    if model:
-        parts.append(model)
+    description = f"{model_part}{capacity_part}{serial_part}".rstrip()
+    if not description:
+        return device_path
     
-    if capacity_bytes > 0:
-        capacity_str = render.bytes(capacity_bytes)
-        parts.append(f"({capacity_str})")
+    # Extract device name from path (e.g., sda from /dev/sda)
+    device_name = device_path.rpartition('/')[2] or device_path
+    return f"{description} ({device_name})"
+
+
+def _normalize_device_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop malformed counter entries, fill in missing fields so the check can index them directly"""
+    error_counters = data.get("error_counters")
+    if error_counters is None:
+        return data
+    if not isinstance(error_counters, dict):
+        # Not a per-operation mapping, the check reports it as missing counter data
+        data["error_counters"] = {}
+        return data
     
+    error_counters = data["error_counters"] = {
+        operation: counters for operation, counters in error_counters.items() if isinstance(counters, dict)
+    }
+    for counters in error_counters.values():
+        for key, default in _COUNTER_DEFAULTS:
+            counters.setdefault(key, default)
+    return data
+
+
+def _service_item(device_name: str, data: Dict[str, Any]) -> str:
+    """Service item: device name plus serial number for unique identification"""
+    serial = data.get("serial", "")
     if serial:
-        # Show last 8 characters of serial for identification
-        serial_short = serial[-8:] if len(serial) > 8 else serial
-        parts.append(f"S/N: {serial_short}")
+        # Use last 8 chars of serial for uniqueness
+        return f"{device_name} ({_short_serial(serial)})"
+    # Fallback to device name with "no-serial" if no serial available
+    return f"{device_name} (no-serial)"
+
+
+def _index_service_items(devices: Devices) -> Section:
+    """Index service items so discovery and the check need no string parsing"""
+    item_index = {}
+    for device_name, data in devices.items():
+        if "error" not in data:
+            item_index[_service_item(device_name, data)] = device_name
+    return Section(devices, item_index)
+
+
+def _parse_consolidated(string_table: StringTable) -> Optional[Devices]:
+    """Parse the single-document form {"<device>": {...}, ...}, None if not in that form"""
+    if len(string_table) != 1 or not string_table[0] or string_table[0][0].lstrip()[:1] != "{":
+        return None
     
-    if parts:
-        # Extract device name from path (e.g., sda from /dev/sda)
-        device_name = device_path.split('/')[-1] if '/' in device_path else device_path
-        return f"{' '.join(parts)} ({device_name})"
-    else:
-        return device_path
+    # The JSON document may itself contain the '|' separator
+    try:
+        devices = _json_loads("|".join(string_table[0]))
+    except _JSON_DECODE_ERRORS:
+        return None
+    if not isinstance(devices, dict):
+        return None
+    
+    return {
+        device_name: _normalize_device_data(data) if isinstance(data, dict) else {"error": "Invalid JSON data"}
+        for device_name, data in devices.items()
+    }
 
 
 def parse_oposs_smart_error(string_table: StringTable) -> Section:
     """Parse SMART error data from agent output"""
-    section = {}
+    # One JSON document for all devices needs a single decoder call
+    devices = _parse_consolidated(string_table)
+    if devices is not None:
+        return _index_service_items(devices)
+    
+    devices = {}
+    # Local names for the per-line loop
+    loads = _json_loads
+    decode_errors = _JSON_DECODE_ERRORS
     
     for line in string_table:
-        if len(line) < 2:
+        line_len = len(line)
+        if line_len < 2:
             continue
             
         device_name = line[0]
+        payload = line[1]
         
-        if line[1] == "ERROR":
+        # Cheap first-character guard, JSON payloads never start with "E"
+        if payload[:1] == "E" and payload == "ERROR":
             # Handle error cases
-            error_msg = line[2] if len(line) > 2 else "Unknown error"
-            section[device_name] = {"error": error_msg}
+            error_msg = line[2] if line_len > 2 else "Unknown error"
+            devices[device_name] = {"error": error_msg}
+            continue
+        
+        # Every device record is a JSON object, don't bother the parser otherwise
+        if payload.lstrip()[:1] != "{":
+            devices[device_name] = {"error": "Invalid JSON data"}
             continue
         
         try:
-            data = json.loads(line[1])
-            section[device_name] = data
-        except json.JSONDecodeError:
-            section[device_name] = {"error": "Invalid JSON data"}
+            data = loads(payload)
+        except decode_errors:
+            devices[device_name] = {"error": "Invalid JSON data"}
+            continue
+        
+        devices[device_name] = _normalize_device_data(data)
     
-    return section
+    return _index_service_items(devices)
 
 
 def discover_oposs_smart_error(section: Section) -> DiscoveryResult:
     """Discover SMART error services"""
-    for device_name, data in section.items():
-        if "error" not in data:
-            # Always create service item with device name and serial number for unique identification
-            serial = data.get("serial", "")
-            if serial:
-                # Use last 8 chars of serial for uniqueness
-                serial_short = serial[-8:] if len(serial) > 8 else serial
-                service_item = f"{device_name} ({serial_short})"
-            else:
-                # Fallback to device name with "no-serial" if no serial available
-                service_item = f"{device_name} (no-serial)"
-            yield Service(item=service_item)
+    # Service items were built by the parse function, see _index_service_items()
+    for service_item in section.item_index:
+        yield Service(item=service_item)
 
 
 def check_oposs_smart_error(item: str, params: Mapping[str, Any], section: Section) -> CheckResult:
     """Check SMART error counters and generate metrics"""
-    # Extract device name from service item format: "/dev/sda (serial)"
-    if " (" in item and item.endswith(")"):
-        device_name = item.split(" (")[0].strip()
-    else:
-        # Should not happen with current discovery logic, but handle gracefully
-        device_name = item.strip()
+    device_name = section.item_index.get(item)
+    if device_name is None:
+        # Item from an earlier discovery (e.g. the disk was swapped) or a device
+        # with an error record: extract the device name from "/dev/sda (serial)"
+        head, sep, _ = item.rpartition(" (")
+        if sep and item.endswith(")"):
+            device_name = head
+        else:
+            # Should not happen with current discovery logic, but handle gracefully
+            device_name = item.strip()
     
-    if device_name not in section:
+    devices = section.devices
+    if device_name not in devices:
         yield Result(state=State.UNKNOWN, summary=f"Device {device_name} not found")
         return
     
-    data = section[device_name]
+    data = devices[device_name]
     
     if "error" in data:
         yield Result(state=State.CRIT, summary=f"Error: {data['error']}")
         return
     
-    error_counters = data.get("error_counters", {})
-    device_info = data.get("device", device_name)
-    protocol = data.get("protocol", "unknown")
-    model = data.get("model", "")
-    serial = data.get("serial", "")
-    capacity_bytes = data.get("capacity_bytes", 0)
+    get = data.get
+    error_counters = get("error_counters", {})
+    device_info = get("device", device_name)
+    model = get("model", "")
+    serial = get("serial", "")
+    capacity_bytes = get("capacity_bytes", 0)
     
     # Create friendly device description
     device_desc = _create_device_description(device_info, model, serial, capacity_bytes)
@@ -130,157 +322,98 @@ def check_oposs_smart_error(item: str, params: Mapping[str, Any], section: Secti
         yield Result(state=State.UNKNOWN, summary=f"{device_desc}: No error counter data available")
         return
     
+    # Bind the globals used in the per-operation loops to locals
+    state_ok = State.OK
+    render_bytes = render.bytes
+    new_metric = Metric
+    new_result = Result
+    
+    # Collect everything and hand it over in one go rather than suspending per item
+    out: List[Any] = []
+    emit = out.append
+    
     # Process each operation type (read, write, verify)
-    read_processed_gb = 0.0
-    write_processed_gb = 0.0
-    verify_processed_gb = 0.0
+    processed_bytes_totals = [0.0] * len(_OPERATIONS)
+    op_results: Dict[str, List[Any]] = {}
     
+    # Non-dict counter entries were dropped by the parse function
     for operation, counters in error_counters.items():
-        if not isinstance(counters, dict):
-            continue
-        
         # Extract all detailed fields from SMART data
-        eccfast = counters.get("errors_corrected_by_eccfast", 0)
-        eccdelayed = counters.get("errors_corrected_by_eccdelayed", 0)
-        rereads = counters.get("errors_corrected_by_rereads_rewrites", 0)
-        corrected = counters.get("total_errors_corrected", 0)
-        algorithm_invocations = counters.get("correction_algorithm_invocations", 0)
-        processed_gb = float(counters.get("gigabytes_processed", "0"))
-        processed_bytes = processed_gb * (1024 ** 3)  # Convert GB to bytes
-        uncorrected = counters.get("total_uncorrected_errors", 0)
+        # (missing fields were defaulted by the parse function)
+        eccfast = counters["errors_corrected_by_eccfast"]
+        eccdelayed = counters["errors_corrected_by_eccdelayed"]
+        rereads = counters["errors_corrected_by_rereads_rewrites"]
+        algorithm_invocations = counters["correction_algorithm_invocations"]
+        processed_gb = counters["gigabytes_processed"]
+        if not isinstance(processed_gb, float):
+            # Older agents pass on smartctl's string value
+            processed_gb = float(processed_gb)
+        processed_bytes = processed_gb * _BYTES_PER_GB
+        uncorrected = counters["total_uncorrected_errors"]
         
         # Track operation-specific processed bytes
-        if operation == "read":
-            read_processed_gb += processed_gb
-        elif operation == "write":
-            write_processed_gb += processed_gb
-        elif operation == "verify":
-            verify_processed_gb += processed_gb
+        op_index = _OPERATION_INDEX.get(operation)
+        if op_index is not None:
+            processed_bytes_totals[op_index] += processed_bytes
         
         # Generate detailed absolute metrics (6 values - excluding redundant total_errors_corrected)
-        yield Metric(f"{operation}_errors_corrected_by_eccfast", eccfast)
-        yield Metric(f"{operation}_errors_corrected_by_eccdelayed", eccdelayed)
-        yield Metric(f"{operation}_errors_corrected_by_rereads_rewrites", rereads)
-        yield Metric(f"{operation}_correction_algorithm_invocations", algorithm_invocations)
-        yield Metric(f"{operation}_bytes_processed", processed_bytes)
-        yield Metric(f"{operation}_total_uncorrected_errors", uncorrected)
+        names = _METRIC_NAMES.get(operation) or _build_metric_names(operation)
+        emit(new_metric(names["eccfast"], eccfast))
+        emit(new_metric(names["eccdelayed"], eccdelayed))
+        emit(new_metric(names["rereads"], rereads))
+        emit(new_metric(names["algorithm"], algorithm_invocations))
+        emit(new_metric(names["bytes"], processed_bytes))
+        emit(new_metric(names["uncorrected"], uncorrected))
         
         # Generate detailed relative metrics per TB (4 values - excluding uncorrected errors)
         if processed_gb > 0:
-            processed_tb = processed_gb / 1024  # Convert GB to TB
-            yield Metric(f"{operation}_errors_corrected_by_eccfast_per_tb", eccfast / processed_tb)
-            yield Metric(f"{operation}_errors_corrected_by_eccdelayed_per_tb", eccdelayed / processed_tb)
-            yield Metric(f"{operation}_errors_corrected_by_rereads_rewrites_per_tb", rereads / processed_tb)
-            yield Metric(f"{operation}_correction_algorithm_invocations_per_tb", algorithm_invocations / processed_tb)
-    
-    
-    # Device info summary
-    yield Result(state=State.OK, summary=device_desc)
-    
-    # Individual error type results with their own states
-    for operation in ["read", "write", "verify"]:
-        if operation in error_counters:
-            counters = error_counters[operation]
-            if isinstance(counters, dict):
-                uncorrected = counters.get("total_uncorrected_errors", 0)
-                eccfast = counters.get("errors_corrected_by_eccfast", 0)
-                eccdelayed = counters.get("errors_corrected_by_eccdelayed", 0)
-                rereads = counters.get("errors_corrected_by_rereads_rewrites", 0)
-                algorithm_invocations = counters.get("correction_algorithm_invocations", 0)
+            per_tb = _GB_PER_TB / processed_gb  # one reciprocal instead of four divisions
+            per_tb_names = _PER_TB_NAMES.get(operation) or _build_per_tb_names(operation)
+            emit(new_metric(per_tb_names["eccfast"], eccfast * per_tb))
+            emit(new_metric(per_tb_names["eccdelayed"], eccdelayed * per_tb))
+            emit(new_metric(per_tb_names["rereads"], rereads * per_tb))
+            emit(new_metric(per_tb_names["algorithm"], algorithm_invocations * per_tb))
+        
+        # Individual error type results with their own states, emitted after the device summary
+        if operation in _THRESHOLD_CHECKS:
+            results = op_results[operation] = []
+            
+            for param_key, field, metric_name, label, summary_label, default_levels in _THRESHOLD_CHECKS[operation]:
+                value = counters[field]
+                if value <= 0:
+                    continue
+                
+                levels_upper = _norm_levels(params.get(param_key))
+                if levels_upper is None:
+                    levels_upper = default_levels
                 
-                # Uncorrected errors
-                if uncorrected > 0:
-                    param_key = f"{operation}_uncorrected_errors_abs"
-                    levels_param = params.get(param_key)
-                    
-                    # Handle SimpleLevels format from rulesets
-                    if levels_param and isinstance(levels_param, dict) and 'levels_upper' in levels_param:
-                        levels_upper = ("fixed", levels_param['levels_upper'])
-                    else:
-                        # Default behavior - any uncorrected errors are critical
-                        levels_upper = ("fixed", (1, 1)) 
-                    
-                    yield from check_levels(
-                        uncorrected,
+                if levels_upper is not None:
+                    results.extend(check_levels(
+                        value,
                         levels_upper=levels_upper,
-                        metric_name=f"{operation}_uncorrected_check",
-                        label=f"{operation.capitalize()} uncorrected errors",
+                        metric_name=metric_name,
+                        label=label,
                         render_func=_render_error_count,
-                    )
-                
-                # ECC fast errors
-                if eccfast > 0:
-                    param_key = f"{operation}_eccfast_errors_abs"
-                    levels_param = params.get(param_key)
-                    
-                    if levels_param and isinstance(levels_param, dict) and 'levels_upper' in levels_param:
-                        yield from check_levels(
-                            eccfast,
-                            levels_upper=("fixed", levels_param['levels_upper']),
-                            metric_name=f"{operation}_eccfast_check",
-                            label=f"{operation.capitalize()} ECC fast errors",
-                            render_func=_render_error_count,
-                        )
-                    else:
-                        # No threshold configured - just report the value
-                        yield Result(state=State.OK, summary=f"{operation.capitalize()} ECC fast: {eccfast}")
-                
-                # ECC delayed errors
-                if eccdelayed > 0:
-                    param_key = f"{operation}_eccdelayed_errors_abs"
-                    levels_param = params.get(param_key)
-                    
-                    if levels_param and isinstance(levels_param, dict) and 'levels_upper' in levels_param:
-                        yield from check_levels(
-                            eccdelayed,
-                            levels_upper=("fixed", levels_param['levels_upper']),
-                            metric_name=f"{operation}_eccdelayed_check",
-                            label=f"{operation.capitalize()} ECC delayed errors",
-                            render_func=_render_error_count,
-                        )
-                    else:
-                        # No threshold configured - just report the value
-                        yield Result(state=State.OK, summary=f"{operation.capitalize()} ECC delayed: {eccdelayed}")
-                
-                # Rereads/rewrites errors
-                if rereads > 0:
-                    param_key = f"{operation}_rereads_rewrites_errors_abs"
-                    levels_param = params.get(param_key)
-                    
-                    if levels_param and isinstance(levels_param, dict) and 'levels_upper' in levels_param:
-                        yield from check_levels(
-                            rereads,
-                            levels_upper=("fixed", levels_param['levels_upper']),
-                            metric_name=f"{operation}_rereads_rewrites_check",
-                            label=f"{operation.capitalize()} rereads/rewrites errors",
-                            render_func=_render_error_count,
-                        )
-                    else:
-                        # No threshold configured - just report the value
-                        yield Result(state=State.OK, summary=f"{operation.capitalize()} rereads/rewrites: {rereads}")
-                
-                # Algorithm invocations (only if configured)
-                if algorithm_invocations > 0:
-                    param_key = f"{operation}_algorithm_invocations_abs"
-                    levels_param = params.get(param_key)
-                    
-                    if levels_param and isinstance(levels_param, dict) and 'levels_upper' in levels_param:
-                        yield from check_levels(
-                            algorithm_invocations,
-                            levels_upper=("fixed", levels_param['levels_upper']),
-                            metric_name=f"{operation}_algorithm_invocations_check",
-                            label=f"{operation.capitalize()} algorithm invocations",
-                            render_func=_render_error_count,
-                        )
-                    # If no levels configured, don't report algorithm invocations
+                    ))
+                elif summary_label:
+                    # No threshold configured - just report the value
+                    results.append(new_result(state=state_ok, summary=f"{summary_label}: {value}"))
+    
+    # Device info summary
+    emit(new_result(state=state_ok, summary=device_desc))
+    
+    for operation in _OPERATIONS:
+        out.extend(op_results.get(operation, ()))
     
     # Show operation-specific processed bytes
-    if read_processed_gb > 0:
-        yield Result(state=State.OK, summary=f"Read: {render.bytes(read_processed_gb * 1024**3)} processed")
-    if write_processed_gb > 0:
-        yield Result(state=State.OK, summary=f"Write: {render.bytes(write_processed_gb * 1024**3)} processed")
-    if verify_processed_gb > 0:
-        yield Result(state=State.OK, summary=f"Verify: {render.bytes(verify_processed_gb * 1024**3)} processed")
+    for operation, processed_bytes in zip(_OPERATIONS, processed_bytes_totals):
+        if processed_bytes > 0:
+            emit(new_result(
+                state=state_ok,
+                summary=f"{operation.capitalize()}: {render_bytes(processed_bytes)} processed",
+            ))
+    
+    yield from out
 
 
 # Register the section and check plugin
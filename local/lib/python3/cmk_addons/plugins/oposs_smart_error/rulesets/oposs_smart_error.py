@@ -5,15 +5,9 @@ Defines rule sets and parameter forms for threshold configuration
 Compatible with CheckMK 2.3
 """
 
+from functools import lru_cache
+
 from cmk.rulesets.v1 import Title, Help, Label
-from cmk.rulesets.v1.form_specs import (
-    Dictionary,
-    DictElement,
-    Integer,
-    SimpleLevels,
-    LevelDirection,
-    DefaultValue,
-)
 from cmk.rulesets.v1.rule_specs import (
     CheckParameters,
     HostAndItemCondition,
@@ -21,168 +15,79 @@ from cmk.rulesets.v1.rule_specs import (
 )
 
 
+# Threshold rules: parameter key, title, help text and prefilled (warn, crit) levels.
+# Title/Help stay literal calls so the texts remain translatable.
+_THRESHOLD_SCHEMA = (
+    # Read operation thresholds
+    ("read_uncorrected_errors_abs", Title("Read: Uncorrected Errors (Absolute)"),
+     Help("Thresholds for uncorrected errors during read operations"), (1, 5)),
+    ("read_eccfast_errors_abs", Title("Read: ECC Fast Corrected Errors (Absolute)"),
+     Help("Thresholds for read errors corrected by ECC fast algorithm"), (50000, 500000)),
+    ("read_eccdelayed_errors_abs", Title("Read: ECC Delayed Corrected Errors (Absolute)"),
+     Help("Thresholds for read errors corrected by ECC delayed algorithm"), (5000, 50000)),
+    ("read_rereads_rewrites_errors_abs", Title("Read: Rereads/Rewrites Corrected Errors (Absolute)"),
+     Help("Thresholds for read errors corrected by rereads"), (500, 5000)),
+    ("read_algorithm_invocations_abs", Title("Read: Correction Algorithm Invocations (Absolute)"),
+     Help("Thresholds for read correction algorithm invocations"), (100000, 1000000)),
+
+    # Write operation thresholds
+    ("write_uncorrected_errors_abs", Title("Write: Uncorrected Errors (Absolute)"),
+     Help("Thresholds for uncorrected errors during write operations"), (1, 3)),
+    ("write_eccfast_errors_abs", Title("Write: ECC Fast Corrected Errors (Absolute)"),
+     Help("Thresholds for write errors corrected by ECC fast algorithm"), (10000, 100000)),
+    ("write_eccdelayed_errors_abs", Title("Write: ECC Delayed Corrected Errors (Absolute)"),
+     Help("Thresholds for write errors corrected by ECC delayed algorithm"), (1000, 10000)),
+    ("write_rereads_rewrites_errors_abs", Title("Write: Rereads/Rewrites Corrected Errors (Absolute)"),
+     Help("Thresholds for write errors corrected by rewrites"), (50, 500)),
+    ("write_algorithm_invocations_abs", Title("Write: Correction Algorithm Invocations (Absolute)"),
+     Help("Thresholds for write correction algorithm invocations"), (25000, 250000)),
+
+    # Verify operation thresholds
+    ("verify_uncorrected_errors_abs", Title("Verify: Uncorrected Errors (Absolute)"),
+     Help("Thresholds for uncorrected errors during verify operations"), (1, 5)),
+    ("verify_eccfast_errors_abs", Title("Verify: ECC Fast Corrected Errors (Absolute)"),
+     Help("Thresholds for verify errors corrected by ECC fast algorithm"), (20000, 200000)),
+    ("verify_eccdelayed_errors_abs", Title("Verify: ECC Delayed Corrected Errors (Absolute)"),
+     Help("Thresholds for verify errors corrected by ECC delayed algorithm"), (2000, 20000)),
+    ("verify_rereads_rewrites_errors_abs", Title("Verify: Rereads/Rewrites Corrected Errors (Absolute)"),
+     Help("Thresholds for verify errors corrected by rereads"), (200, 2000)),
+    ("verify_algorithm_invocations_abs", Title("Verify: Correction Algorithm Invocations (Absolute)"),
+     Help("Thresholds for verify correction algorithm invocations"), (50000, 500000)),
+)
+
+
+@lru_cache(maxsize=1)
 def _parameter_form_oposs_smart_error():
     """Form specification for SMART error thresholds"""
+    # Only needed when the GUI renders the form
+    from cmk.rulesets.v1.form_specs import (
+        Dictionary,
+        DictElement,
+        Integer,
+        SimpleLevels,
+        LevelDirection,
+        DefaultValue,
+    )
+    
+    # Form specs are immutable, all levels share one Integer template
+    integer_template = Integer()
+    
     return Dictionary(
         title=Title("SMART Error Counter Thresholds"),
         help_text=Help("Configure thresholds for specific SMART error counter types by operation. "
                "Read, write, and verify operations show different error patterns."),
         elements={
-            # Read operation thresholds
-            "read_uncorrected_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Read: Uncorrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for uncorrected errors during read operations"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((1, 5)),
-                ),
-                required=False,
-            ),
-            "read_eccfast_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Read: ECC Fast Corrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for read errors corrected by ECC fast algorithm"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((50000, 500000)),
-                ),
-                required=False,
-            ),
-            "read_eccdelayed_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Read: ECC Delayed Corrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for read errors corrected by ECC delayed algorithm"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((5000, 50000)),
-                ),
-                required=False,
-            ),
-            "read_rereads_rewrites_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Read: Rereads/Rewrites Corrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for read errors corrected by rereads"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((500, 5000)),
-                ),
-                required=False,
-            ),
-            "read_algorithm_invocations_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Read: Correction Algorithm Invocations (Absolute)"),
-                    help_text=Help("Thresholds for read correction algorithm invocations"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((100000, 1000000)),
-                ),
-                required=False,
-            ),
-            
-            # Write operation thresholds
-            "write_uncorrected_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Write: Uncorrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for uncorrected errors during write operations"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((1, 3)),
-                ),
-                required=False,
-            ),
-            "write_eccfast_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Write: ECC Fast Corrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for write errors corrected by ECC fast algorithm"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((10000, 100000)),
-                ),
-                required=False,
-            ),
-            "write_eccdelayed_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Write: ECC Delayed Corrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for write errors corrected by ECC delayed algorithm"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((1000, 10000)),
-                ),
-                required=False,
-            ),
-            "write_rereads_rewrites_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Write: Rereads/Rewrites Corrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for write errors corrected by rewrites"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((50, 500)),
-                ),
-                required=False,
-            ),
-            "write_algorithm_invocations_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Write: Correction Algorithm Invocations (Absolute)"),
-                    help_text=Help("Thresholds for write correction algorithm invocations"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((25000, 250000)),
-                ),
-                required=False,
-            ),
-            
-            # Verify operation thresholds
-            "verify_uncorrected_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Verify: Uncorrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for uncorrected errors during verify operations"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((1, 5)),
-                ),
-                required=False,
-            ),
-            "verify_eccfast_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Verify: ECC Fast Corrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for verify errors corrected by ECC fast algorithm"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((20000, 200000)),
-                ),
-                required=False,
-            ),
-            "verify_eccdelayed_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Verify: ECC Delayed Corrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for verify errors corrected by ECC delayed algorithm"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((2000, 20000)),
-                ),
-                required=False,
-            ),
-            "verify_rereads_rewrites_errors_abs": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Verify: Rereads/Rewrites Corrected Errors (Absolute)"),
-                    help_text=Help("Thresholds for verify errors corrected by rereads"),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((200, 2000)),
-                ),
-                required=False,
-            ),
-            "verify_algorithm_invocations_abs": DictElement(
+            key: DictElement(
                 parameter_form=SimpleLevels(
-                    title=Title("Verify: Correction Algorithm Invocations (Absolute)"),
-                    help_text=Help("Thresholds for verify correction algorithm invocations"),
+                    title=title,
+                    help_text=help_text,
                     level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(),
-                    prefill_fixed_levels=DefaultValue((50000, 500000)),
+                    form_spec_template=integer_template,
+                    prefill_fixed_levels=DefaultValue(levels),
                 ),
                 required=False,
-            ),
+            )
+            for key, title, help_text, levels in _THRESHOLD_SCHEMA
         }
     )
 
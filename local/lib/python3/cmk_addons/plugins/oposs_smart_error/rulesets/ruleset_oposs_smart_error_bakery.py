@@ -5,21 +5,27 @@ Provides GUI configuration for the agent bakery plugin
 Compatible with CheckMK 2.3
 """
 
+from functools import lru_cache
+
 from cmk.rulesets.v1 import Label, Title, Help
-from cmk.rulesets.v1.form_specs import (
-    BooleanChoice,
-    DefaultValue,
-    DictElement,
-    Dictionary,
-    Integer,
-    TimeSpan,
-    TimeMagnitude
-)
 from cmk.rulesets.v1.rule_specs import AgentConfig, Topic
 
 
+@lru_cache(maxsize=1)
 def _parameter_form_oposs_smart_error():
     """Configuration interface for SMART errors agent plugin"""
+    # Only needed when the GUI renders the form
+    from cmk.rulesets.v1.form_specs import (
+        DefaultValue,
+        DictElement,
+        Dictionary,
+        TimeSpan,
+        TimeMagnitude,
+    )
+    
+    # Both time spans offer the same units
+    magnitudes = (TimeMagnitude.SECOND, TimeMagnitude.MINUTE)
+    
     return Dictionary(
         title=Title("OPOSS SMART Error Monitoring (smartctl)"),
         help_text=Help("This plugin monitors SMART error counters on storage devices. "
@@ -30,7 +36,7 @@ def _parameter_form_oposs_smart_error():
                     title=Title("Execution interval"),
                     label=Label("How often to collect SMART error data"),
                     help_text=Help("0 means every agent run."),
-                    displayed_magnitudes=[TimeMagnitude.SECOND, TimeMagnitude.MINUTE],
+                    displayed_magnitudes=magnitudes,
                     prefill=DefaultValue(1800.0),
                 )
             ),
@@ -39,7 +45,7 @@ def _parameter_form_oposs_smart_error():
                     title=Title("Command execution timeout"),
                     label=Label("Timeout for smartctl commands"),
                     help_text=Help("Set the timeout for each smartctl command execution."),
-                    displayed_magnitudes=[TimeMagnitude.SECOND, TimeMagnitude.MINUTE],
+                    displayed_magnitudes=magnitudes,
                     prefill=DefaultValue(5.0),
                 )
             ),